@@ -1,10 +1,13 @@
 """
 API models for search endpoints
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
+from datetime import date, datetime
 from typing import List, Optional
 from enum import Enum
 
+_VALID_SOURCES = frozenset({"arxiv", "openalex", "crossref"})
+
 
 class SortByAPI(str, Enum):
     RELEVANCE = "relevance"
@@ -21,21 +24,26 @@ class SearchRequest(BaseModel):
     date_from: Optional[str] = Field(default=None, description="Start date filter (YYYY-MM-DD)")
     date_to: Optional[str] = Field(default=None, description="End date filter (YYYY-MM-DD)")
     
-    @validator('sources')
+    @field_validator('sources')
+    @classmethod
     def validate_sources(cls, v):
         if v is not None:
-            valid_sources = {"arxiv", "openalex", "crossref"}
-            invalid_sources = set(v) - valid_sources
+            invalid_sources = [s for s in v if s not in _VALID_SOURCES]
             if invalid_sources:
-                raise ValueError(f"Invalid sources: {invalid_sources}. Valid sources are: {valid_sources}")
+                raise ValueError(
+                    f"Invalid sources: {invalid_sources}. Valid sources are: {sorted(_VALID_SOURCES)}"
+                )
         return v
     
-    @validator('date_from', 'date_to')
+    @field_validator('date_from', 'date_to')
+    @classmethod
     def validate_date_format(cls, v):
         if v is not None:
+            # fromisoformat alone would also accept compact forms like 20240101
+            if len(v) != 10 or not v[4] == v[7] == "-":
+                raise ValueError("Date must be in YYYY-MM-DD format")
             try:
-                from datetime import datetime
-                datetime.strptime(v, '%Y-%m-%d')
+                date.fromisoformat(v)
             except ValueError:
                 raise ValueError("Date must be in YYYY-MM-DD format")
         return v
@@ -56,7 +64,7 @@ class PaperResponse(BaseModel):
     abstract: str
     source: str
     source_name: str
-    published_date: str
+    published_date: datetime
     url: str
     doi: Optional[str] = None
     categories: Optional[List[str]] = None
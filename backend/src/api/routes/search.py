@@ -1,8 +1,13 @@
 """
 Search API routes
 """
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, List
+import hashlib
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from typing import Any, Dict, Optional, List
 
 from ..models.search_models import SearchRequest, SearchResponse, SortByAPI
 from ...application.services.paper_search_service import PaperSearchService
@@ -10,12 +15,23 @@ from ...domain.value_objects.search_query import SearchQuery, SortBy
 
 router = APIRouter(prefix="/api/search", tags=["search"])
 
-# Initialize service
-paper_search_service = PaperSearchService()
+# Browsers and proxies may briefly reuse GET results. Served results can already be up to
+# five minutes old from the service cache, plus ten from the OpenAlex cache, so keep this short.
+# Like the service cache, responses missing a failed or timed-out source are not reused.
+_CACHE_CONTROL = "public, max-age=60"
+_NO_STORE = "no-store"
+
 
+def get_paper_search_service(request: Request) -> PaperSearchService:
+    """Dependency providing the service created in the application lifespan"""
+    return request.app.state.paper_search_service
 
-@router.post("/papers", response_model=SearchResponse)
-async def search_papers(request: SearchRequest) -> SearchResponse:
+
+@router.post("/papers", response_model=SearchResponse, response_class=ORJSONResponse)
+async def search_papers(
+    request: SearchRequest,
+    service: PaperSearchService = Depends(get_paper_search_service)
+) -> ORJSONResponse:
     """
     Search for research papers across multiple sources
     
@@ -23,6 +39,74 @@ async def search_papers(request: SearchRequest) -> SearchResponse:
     or topics. For example, searching for "traffic networks" will return papers about
     spatial-temporal analysis of traffic networks, traffic flow optimization, etc.
     """
+    results = await _execute_search(request, service)
+    
+    # Results are built by our own service, so return them as-is instead of
+    # re-validating every paper against SearchResponse (still used for the docs)
+    return ORJSONResponse(content=results)
+
+
+@router.get("/papers", response_model=SearchResponse, response_class=ORJSONResponse)
+async def search_papers_get(
+    query: str = Query(..., description="Research problem or topic to search for"),
+    max_results: int = Query(default=5, ge=1, le=50, description="Maximum number of results"),
+    sort_by: SortByAPI = Query(default=SortByAPI.RELEVANCE, description="Sort criteria"),
+    sources: Optional[str] = Query(default=None, description="Comma-separated sources (arxiv,openalex,crossref)"),
+    date_from: Optional[str] = Query(default=None, description="Start date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(default=None, description="End date (YYYY-MM-DD)"),
+    if_none_match: Optional[str] = Header(default=None),
+    service: PaperSearchService = Depends(get_paper_search_service)
+) -> Response:
+    """
+    Search for research papers using GET request
+    
+    Alternative endpoint for searching papers using query parameters.
+    Useful for direct browser access or simple integrations.
+    Responses carry an ETag, so repeated requests can be answered with 304 Not Modified.
+    """
+    # Parse sources if provided
+    sources_list = None
+    if sources:
+        sources_list = [s.strip() for s in sources.split(",")]
+    
+    # Build the same request model as POST so both endpoints validate alike
+    try:
+        request = SearchRequest(
+            query=query,
+            max_results=max_results,
+            sort_by=sort_by,
+            sources=sources_list,
+            date_from=date_from,
+            date_to=date_to
+        )
+    except ValidationError as e:
+        # Report it like FastAPI's own query validation (422, locations under "query")
+        raise RequestValidationError(
+            [{**error, "loc": ("query", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+    
+    results = await _execute_search(request, service)
+    response = ORJSONResponse(content=results)
+    
+    # Partial results are not cached by the service, so keep clients from caching them too
+    if any("error" in source for source in results["sources"].values()):
+        response.headers["Cache-Control"] = _NO_STORE
+        return response
+    
+    etag = '"' + hashlib.blake2b(response.body, digest_size=16).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    
+    response.headers.update(headers)
+    return response
+
+
+async def _execute_search(
+    request: SearchRequest,
+    service: PaperSearchService
+) -> Dict[str, Any]:
+    """Run a validated search request through the service, mapping errors to HTTP ones"""
     try:
         # Convert API model to domain value object
         domain_sort_by = SortBy(request.sort_by.value)
@@ -36,9 +120,7 @@ async def search_papers(request: SearchRequest) -> SearchResponse:
         )
         
         # Execute search
-        results = await paper_search_service.search_papers(search_query)
-        
-        return SearchResponse(**results)
+        return await service.search_papers(search_query)
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -46,34 +128,10 @@ async def search_papers(request: SearchRequest) -> SearchResponse:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.get("/papers", response_model=SearchResponse)
-async def search_papers_get(
-    query: str = Query(..., description="Research problem or topic to search for"),
-    max_results: int = Query(default=5, ge=1, le=50, description="Maximum number of results"),
-    sort_by: SortByAPI = Query(default=SortByAPI.RELEVANCE, description="Sort criteria"),
-    sources: Optional[str] = Query(default=None, description="Comma-separated sources (arxiv,openalex,crossref)"),
-    date_from: Optional[str] = Query(default=None, description="Start date (YYYY-MM-DD)"),
-    date_to: Optional[str] = Query(default=None, description="End date (YYYY-MM-DD)")
-) -> SearchResponse:
-    """
-    Search for research papers using GET request
-    
-    Alternative endpoint for searching papers using query parameters.
-    Useful for direct browser access or simple integrations.
-    """
-    # Parse sources if provided
-    sources_list = None
-    if sources:
-        sources_list = [s.strip() for s in sources.split(",")]
-    
-    # Create request object and delegate to POST endpoint
-    request = SearchRequest(
-        query=query,
-        max_results=max_results,
-        sort_by=sort_by,
-        sources=sources_list,
-        date_from=date_from,
-        date_to=date_to
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against our ETag"""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
     )
-    
-    return await search_papers(request)
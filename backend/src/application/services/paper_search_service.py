@@ -3,16 +3,29 @@ Paper search service - Application layer
 Orchestrates paper search across multiple repositories
 """
 import asyncio
-from typing import List, Dict, Any
-from dataclasses import asdict
+import heapq
+import logging
+import re
+from functools import partial
+from typing import List, Dict, Any, Optional, Set, Tuple
 
-from ...domain.entities.paper import Paper
+import httpx
+from cachetools import TTLCache
+
+from ...domain.entities.paper import Author, Paper
 from ...domain.repositories.paper_repository import PaperRepository
-from ...domain.value_objects.search_query import SearchQuery
+from ...domain.value_objects.search_query import SearchQuery, SortBy
 from ...infrastructure.repositories.arxiv_repository import ArxivRepositoryImpl
 from ...infrastructure.repositories.openalex_repository import OpenAlexRepositoryImpl
 from ...infrastructure.repositories.crossref_repository import CrossrefRepositoryImpl
 
+logger = logging.getLogger(__name__)
+
+# Punctuation, underscores and whitespace are ignored when comparing titles
+_NON_ALPHANUMERIC = re.compile(r"[\W_]+")
+# OpenAlex reports DOIs as URLs while Crossref reports the bare DOI
+_DOI_URL_PREFIX = re.compile(r"^https?://(dx\.)?doi\.org/", re.IGNORECASE)
+
 
 class PaperSearchService:
     """
@@ -20,61 +33,138 @@ class PaperSearchService:
     Follows Single Responsibility Principle and orchestrates domain operations
     """
     
-    def __init__(self):
+    def __init__(self, openalex_client: Optional[httpx.AsyncClient] = None):
         self.repositories: Dict[str, PaperRepository] = {
             "arxiv": ArxivRepositoryImpl(),
-            "openalex": OpenAlexRepositoryImpl(),
+            "openalex": OpenAlexRepositoryImpl(client=openalex_client),
             "crossref": CrossrefRepositoryImpl()
         }
+        # Seconds to wait for a single source, and for the whole fan-out
+        self.source_timeout = 8.0
+        self.search_deadline = 10.0
+        # Serialized responses for recently seen queries
+        self._results_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        # Searches currently running, so identical concurrent queries share one fan-out
+        self._in_flight: Dict[Tuple, asyncio.Task] = {}
     
     async def search_papers(self, search_query: SearchQuery) -> Dict[str, Any]:
         """
         Search papers from enabled sources and return aggregated results
+        Identical queries are answered from cache for a few minutes
+        """
+        key = self._cache_key(search_query)
+        
+        cached = self._results_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._search_sources(search_query))
+            task.add_done_callback(partial(self._on_search_done, key))
+            self._in_flight[key] = task
+        
+        # Shield so one cancelled caller does not cancel the search for the others
+        return await asyncio.shield(task)
+    
+    async def aclose(self) -> None:
+        """Close connections held by the repositories"""
+        await asyncio.gather(
+            *(repository.aclose() for repository in self.repositories.values())
+        )
+    
+    def _on_search_done(self, key: Tuple, task: asyncio.Task) -> None:
+        """Store a finished search in the cache and release its in-flight slot"""
+        del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        # Don't keep results missing a source that failed or timed out
+        results = task.result()
+        if not any("error" in source for source in results["sources"].values()):
+            self._results_cache[key] = results
+    
+    def _cache_key(self, search_query: SearchQuery) -> Tuple:
+        """Build a hashable cache key from the search parameters"""
+        return (
+            search_query.query,
+            search_query.max_results,
+            search_query.sort_by.value,
+            tuple(search_query.enabled_sources),
+            search_query.date_from,
+            search_query.date_to
+        )
+    
+    async def _search_sources(self, search_query: SearchQuery) -> Dict[str, Any]:
+        """
+        Fan the query out to the enabled repositories and aggregate the results
         """
         # Create search tasks for enabled sources
-        search_tasks = []
+        search_tasks: Dict[str, asyncio.Task] = {}
         enabled_sources = search_query.enabled_sources
         
         for source in enabled_sources:
             if source in self.repositories:
                 repository = self.repositories[source]
-                task = asyncio.create_task(
-                    self._safe_search(repository, search_query, source)
+                search_tasks[source] = asyncio.create_task(
+                    self._safe_search(repository, search_query)
                 )
-                search_tasks.append(task)
         
-        # Execute all searches concurrently
-        results = await asyncio.gather(*search_tasks, return_exceptions=True)
+        # Execute all searches concurrently, giving up on sources that miss the deadline
+        pending = set()
+        if search_tasks:
+            _, pending = await asyncio.wait(
+                search_tasks.values(), timeout=self.search_deadline
+            )
+            for task in pending:
+                task.cancel()
         
-        # Aggregate results
-        all_papers = []
-        source_results = {}
+        # Collect papers per source
+        source_papers: Dict[str, List[Paper]] = {}
+        source_errors: Dict[str, str] = {}
         
-        for i, result in enumerate(results):
-            source = enabled_sources[i] if i < len(enabled_sources) else "unknown"
-            
-            if isinstance(result, Exception):
-                print(f"Error in {source} search: {result}")
-                source_results[source] = {"papers": [], "error": str(result)}
+        for source, task in search_tasks.items():
+            if task in pending or isinstance(task.exception(), asyncio.TimeoutError):
+                logger.warning("Timed out searching %s", source)
+                source_errors[source] = "timeout"
+            elif task.exception() is not None:
+                exc = task.exception()
+                logger.error("Error searching %s", source, exc_info=exc)
+                source_errors[source] = self._describe_error(exc)
             else:
-                papers = result
-                all_papers.extend(papers)
-                source_results[source] = {
-                    "papers": [self._paper_to_dict(paper) for paper in papers],
-                    "count": len(papers)
-                }
+                source_papers[source] = task.result()
         
-        # Sort and deduplicate papers
+        # Deduplicate papers and keep the best ranked ones
+        all_papers = [paper for papers in source_papers.values() for paper in papers]
         unique_papers = self._deduplicate_papers(all_papers)
-        sorted_papers = self._sort_papers(unique_papers, search_query.sort_by)
+        limited_papers = self._top_papers(
+            unique_papers, source_papers, search_query.sort_by, search_query.max_results
+        )
         
-        # Limit results
-        limited_papers = sorted_papers[:search_query.max_results]
+        # Convert each paper once; the per-source listings share the same dicts
+        serialized: Dict[int, Dict[str, Any]] = {}
+        papers = [self._serialize_paper(paper, serialized) for paper in limited_papers]
+        
+        source_results = {}
+        for source in search_tasks:
+            if source in source_errors:
+                source_results[source] = {
+                    "papers": [],
+                    "count": 0,
+                    "error": source_errors[source]
+                }
+            else:
+                source_results[source] = {
+                    "papers": [
+                        self._serialize_paper(paper, serialized)
+                        for paper in source_papers[source]
+                    ],
+                    "count": len(source_papers[source])
+                }
         
         return {
             "query": search_query.query,
-            "total_results": len(limited_papers),
-            "papers": [self._paper_to_dict(paper) for paper in limited_papers],
+            "total_results": len(papers),
+            "papers": papers,
             "sources": source_results,
             "search_params": {
                 "max_results": search_query.max_results,
@@ -86,68 +176,138 @@ class PaperSearchService:
     async def _safe_search(
         self, 
         repository: PaperRepository, 
-        search_query: SearchQuery, 
-        source: str
+        search_query: SearchQuery
     ) -> List[Paper]:
         """
-        Safely execute search with error handling
+        Execute a repository search bounded by the per-source timeout
+        Timeouts and failures are raised so they can be reported for the source
+        """
+        return await asyncio.wait_for(
+            repository.search_papers(search_query), timeout=self.source_timeout
+        )
+    
+    def _describe_error(self, exc: BaseException) -> str:
+        """
+        Short error for API clients; httpx messages include the request URL
+        and query parameters, so those stay in the logs only
         """
-        try:
-            return await repository.search_papers(search_query)
-        except Exception as e:
-            print(f"Error searching {source}: {e}")
-            return []
+        if isinstance(exc, httpx.HTTPStatusError):
+            return f"HTTP {exc.response.status_code}"
+        return type(exc).__name__
+    
+    def _serialize_paper(
+        self, 
+        paper: Paper, 
+        serialized: Dict[int, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Convert a paper to a dict, reusing an earlier conversion of it"""
+        paper_dict = serialized.get(id(paper))
+        if paper_dict is None:
+            paper_dict = serialized[id(paper)] = self._paper_to_dict(paper)
+        return paper_dict
     
     def _paper_to_dict(self, paper: Paper) -> Dict[str, Any]:
         """Convert Paper entity to dictionary for API response"""
-        paper_dict = asdict(paper)
-        
-        # Convert datetime to ISO string
-        if paper_dict.get("published_date"):
-            paper_dict["published_date"] = paper.published_date.isoformat()
-        
-        # Add formatted fields
-        paper_dict["formatted_authors"] = paper.formatted_authors
-        paper_dict["primary_author"] = asdict(paper.primary_author)
-        paper_dict["source_name"] = paper.source.value
-        
-        return paper_dict
+        return {
+            "id": paper.id,
+            "title": paper.title,
+            "authors": [self._author_to_dict(author) for author in paper.authors],
+            "abstract": paper.abstract,
+            "source": paper.source.value,
+            "published_date": paper.published_date,
+            "url": paper.url,
+            "doi": paper.doi,
+            "categories": paper.categories,
+            "citation_count": paper.citation_count,
+            "formatted_authors": paper.formatted_authors,
+            "primary_author": self._author_to_dict(paper.primary_author),
+            "source_name": paper.source.value
+        }
+    
+    def _author_to_dict(self, author: Author) -> Dict[str, Any]:
+        """Convert Author value object to dictionary for API response"""
+        return {
+            "name": author.name,
+            "affiliation": author.affiliation,
+            "orcid": author.orcid
+        }
     
     def _deduplicate_papers(self, papers: List[Paper]) -> List[Paper]:
         """
-        Remove duplicate papers based on title similarity and DOI
+        Remove duplicate papers based on normalized title and DOI
         """
-        seen_titles = set()
-        seen_dois = set()
+        seen_titles: Set[int] = set()
+        seen_dois: Set[str] = set()
         unique_papers = []
         
         for paper in papers:
-            # Check DOI first (most reliable)
-            if paper.doi and paper.doi in seen_dois:
-                continue
-            
-            # Check title similarity (simple approach)
-            normalized_title = paper.title.lower().strip()
-            if normalized_title in seen_titles:
+            title_key = self._title_key(paper.title)
+            doi = self._normalize_doi(paper.doi)
+            if title_key in seen_titles or (doi and doi in seen_dois):
                 continue
             
-            # Add to unique set
             unique_papers.append(paper)
-            seen_titles.add(normalized_title)
-            if paper.doi:
-                seen_dois.add(paper.doi)
+            seen_titles.add(title_key)
+            if doi:
+                seen_dois.add(doi)
         
         return unique_papers
     
-    def _sort_papers(self, papers: List[Paper], sort_by) -> List[Paper]:
-        """Sort papers based on the specified criteria"""
-        if sort_by.value == "date":
-            return sorted(papers, key=lambda p: p.published_date, reverse=True)
-        elif sort_by.value == "citations":
-            return sorted(
-                papers, 
-                key=lambda p: p.citation_count or 0, 
-                reverse=True
-            )
-        else:  # relevance - keep original order from APIs
-            return papers
+    def _title_key(self, title: str) -> int:
+        """Hash of the title with case, punctuation and spacing removed"""
+        folded = title.casefold()
+        return hash(_NON_ALPHANUMERIC.sub("", folded) or folded.strip())
+    
+    def _normalize_doi(self, doi: Optional[str]) -> Optional[str]:
+        """Bare, lowercased DOI so that URL and plain forms compare equal"""
+        if not doi:
+            return None
+        return _DOI_URL_PREFIX.sub("", doi.strip()).lower()
+    
+    def _top_papers(
+        self, 
+        papers: List[Paper], 
+        source_papers: Dict[str, List[Paper]], 
+        sort_by: SortBy, 
+        limit: int
+    ) -> List[Paper]:
+        """
+        Return the best `limit` papers based on the specified criteria
+        Ties keep the order in which the sources returned the papers
+        """
+        if sort_by == SortBy.DATE:
+            return heapq.nlargest(limit, papers, key=lambda p: p.published_date)
+        elif sort_by == SortBy.CITATIONS:
+            return heapq.nlargest(limit, papers, key=lambda p: p.citation_count or 0)
+        else:  # relevance - fuse the rankings returned by each API
+            scores = self._fuse_rankings(papers, source_papers)
+            best = heapq.nlargest(limit, range(len(papers)), key=scores.__getitem__)
+            return [papers[i] for i in best]
+    
+    def _fuse_rankings(
+        self, 
+        papers: List[Paper], 
+        source_papers: Dict[str, List[Paper]]
+    ) -> List[float]:
+        """
+        Score deduplicated papers by the sum of reciprocal ranks that they,
+        or their duplicates, hold in each source's result list
+        """
+        title_index: Dict[int, int] = {}
+        doi_index: Dict[str, int] = {}
+        for i, paper in enumerate(papers):
+            title_index[self._title_key(paper.title)] = i
+            doi = self._normalize_doi(paper.doi)
+            if doi:
+                doi_index[doi] = i
+        
+        scores = [0.0] * len(papers)
+        for ranked in source_papers.values():
+            for rank, paper in enumerate(ranked, start=1):
+                i = title_index.get(self._title_key(paper.title))
+                if i is None:
+                    i = doi_index.get(self._normalize_doi(paper.doi))
+                if i is not None:
+                    scores[i] += 1.0 / rank
+        
+        return scores
@@ -2,7 +2,7 @@
 """
 Paper entity - Core domain model
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 from enum import Enum
@@ -14,7 +14,7 @@ class PaperSource(Enum):
     CROSSREF = "crossref"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Author:
     """Value object representing a paper author"""
     name: str
@@ -22,7 +22,7 @@ class Author:
     orcid: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Paper:
     """
     Paper entity - represents a research paper from any source
@@ -38,6 +38,7 @@ class Paper:
     doi: Optional[str] = None
     categories: List[str] = None
     citation_count: Optional[int] = None
+    _formatted_authors: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.title.strip():
@@ -46,6 +47,8 @@ class Paper:
             raise ValueError("Paper must have at least one author")
         if not self.abstract.strip():
             raise ValueError("Paper abstract cannot be empty")
+        # Computed once since the entity is immutable
+        object.__setattr__(self, "_formatted_authors", self._format_authors())
     
     @property
     def primary_author(self) -> Author:
@@ -55,6 +58,10 @@ class Paper:
     @property
     def formatted_authors(self) -> str:
         """Returns formatted author names for display"""
+        return self._formatted_authors
+    
+    def _format_authors(self) -> str:
+        """Joins up to three author names, otherwise abbreviates with et al."""
         if len(self.authors) == 1:
             return self.authors[0].name
         elif len(self.authors) <= 3:
@@ -17,7 +17,15 @@ class PaperRepository(ABC):
     async def search_papers(self, search_query: SearchQuery) -> List[Paper]:
         """
         Search for papers based on the provided query
-        Returns a list of Paper entities
+        Returns a list of Paper entities; request and response failures are
+        raised so the caller can report the source as failed
+        """
+        pass
+    
+    async def aclose(self) -> None:
+        """
+        Release resources held by the repository (e.g. HTTP connections)
+        Implementations without such resources can rely on this no-op
         """
         pass
 
@@ -12,7 +12,7 @@ class SortBy(Enum):
     CITATIONS = "citations"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchQuery:
     """
     Value object representing a search query for research papers
@@ -2,16 +2,39 @@
 ArXiv repository implementation
 """
 import httpx
-import feedparser
 from datetime import datetime
-from typing import List
-from urllib.parse import quote
+from functools import lru_cache
+from typing import List, Optional
+
+from lxml import etree
 
 from ...domain.entities.paper import Paper, Author, PaperSource
 from ...domain.repositories.paper_repository import ArxivRepository
 from ...domain.value_objects.search_query import SearchQuery
 
 
+# Atom element names used by the arXiv API, in lxml's {namespace}tag form
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ENTRY = f"{_ATOM}entry"
+_ID = f"{_ATOM}id"
+_TITLE = f"{_ATOM}title"
+_SUMMARY = f"{_ATOM}summary"
+_PUBLISHED = f"{_ATOM}published"
+_AUTHOR_NAME = f"{_ATOM}author/{_ATOM}name"
+_LINK = f"{_ATOM}link"
+_CATEGORY = f"{_ATOM}category"
+
+# Feeds come from a remote service, so never resolve entities or fetch DTDs
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an arXiv UTC timestamp such as 2021-01-01T12:34:56Z"""
+    # Drop the trailing 'Z' so dates stay naive like those from the other sources
+    return datetime.fromisoformat(value[:-1] if value.endswith("Z") else value)
+
+
 class ArxivRepositoryImpl(ArxivRepository):
     """
     ArXiv repository implementation using arXiv API
@@ -19,26 +42,32 @@ class ArxivRepositoryImpl(ArxivRepository):
     """
     
     def __init__(self):
-        self.base_url = "http://export.arxiv.org/api/query"
+        # HTTPS so the client can negotiate HTTP/2 (httpx only does so via TLS ALPN)
+        self.base_url = "https://export.arxiv.org/api/query"
         self.timeout = 30.0
+        # Shared client so connections are kept alive across searches
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
     
     async def search_papers(self, search_query: SearchQuery) -> List[Paper]:
         """Search papers from arXiv based on query"""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = self._build_search_params(search_query)
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                
-                return self._parse_response(response.text)
-        except Exception as e:
-            # In production, you'd want proper logging here
-            print(f"Error searching arXiv: {e}")
-            return []
+        params = self._build_search_params(search_query)
+        response = await self._client.get(self.base_url, params=params)
+        response.raise_for_status()
+        
+        return self._parse_response(response.content)
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
     
     def _build_search_params(self, search_query: SearchQuery) -> dict:
         """Build search parameters for arXiv API"""
-        # ArXiv search query format: search_query=all:traffic+AND+all:networks
+        # ArXiv search query format: search_query=all:traffic AND all:networks
+        # httpx URL-encodes the spaces, so no manual "+" joining is needed
         formatted_query = self._format_query_for_arxiv(search_query.query)
         
         params = {
@@ -50,16 +79,12 @@ class ArxivRepositoryImpl(ArxivRepository):
         }
         return params
     
-    def _format_query_for_arxiv(self, query: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _format_query_for_arxiv(query: str) -> str:
         """Format search query for arXiv API"""
-        # Split query into words and search in title, abstract, and comments
-        words = query.strip().split()
-        if len(words) == 1:
-            return f"all:{words[0]}"
-        
-        # For multi-word queries, search for all words
-        formatted_words = [f"all:{word}" for word in words]
-        return "+AND+".join(formatted_words)
+        # Search every word in title, abstract, and comments
+        return " AND ".join(f"all:{word}" for word in query.split())
     
     def _map_sort_by(self, sort_by) -> str:
         """Map our sort_by enum to arXiv sort parameters"""
@@ -70,46 +95,64 @@ class ArxivRepositoryImpl(ArxivRepository):
         }
         return mapping.get(sort_by.value, "relevance")
     
-    def _parse_response(self, response_text: str) -> List[Paper]:
-        """Parse arXiv API response and convert to Paper entities"""
-        feed = feedparser.parse(response_text)
+    def _parse_response(self, content: bytes) -> List[Paper]:
+        """Parse arXiv Atom response and convert to Paper entities"""
+        root = etree.fromstring(content, parser=_XML_PARSER)
         papers = []
         
-        for entry in feed.entries:
-            try:
-                paper = self._convert_entry_to_paper(entry)
+        for entry in root.iterfind(_ENTRY):
+            paper = self._convert_entry_to_paper(entry)
+            if paper:
                 papers.append(paper)
-            except Exception as e:
-                print(f"Error parsing arXiv entry: {e}")
-                continue
         
         return papers
     
-    def _convert_entry_to_paper(self, entry) -> Paper:
-        """Convert arXiv entry to Paper entity"""
+    def _convert_entry_to_paper(self, entry: etree._Element) -> Optional[Paper]:
+        """Convert arXiv Atom entry element to Paper entity"""
+        # Skip entries missing a title or abstract
+        title = entry.findtext(_TITLE, "").replace("\n", " ").strip()
+        abstract = entry.findtext(_SUMMARY, "").replace("\n", " ").strip()
+        if not title or not abstract:
+            return None
+        
         # Extract authors
-        authors = []
-        for author in entry.authors:
-            authors.append(Author(name=author.name))
+        authors = [Author(name=name.text) for name in entry.iterfind(_AUTHOR_NAME) if name.text]
+        if not authors:
+            return None
         
         # Extract categories
-        categories = []
-        if hasattr(entry, 'tags'):
-            categories = [tag.term for tag in entry.tags]
+        categories = [
+            category.get("term") for category in entry.iterfind(_CATEGORY)
+            if category.get("term")
+        ]
         
         # Parse published date
-        published_date = datetime.strptime(entry.published, "%Y-%m-%dT%H:%M:%SZ")
+        published = entry.findtext(_PUBLISHED)
+        if not published:
+            return None
+        try:
+            published_date = _parse_timestamp(published)
+        except ValueError:
+            return None
         
         # Extract arXiv ID from the entry ID
-        arxiv_id = entry.id.split("/")[-1]
+        entry_id = entry.findtext(_ID, "")
+        arxiv_id = entry_id.split("/")[-1]
         
         return Paper(
             id=f"arxiv:{arxiv_id}",
-            title=entry.title.replace("\n", " ").strip(),
+            title=title,
             authors=authors,
-            abstract=entry.summary.replace("\n", " ").strip(),
+            abstract=abstract,
             source=PaperSource.ARXIV,
             published_date=published_date,
-            url=entry.link,
+            url=self._find_html_link(entry) or entry_id,
             categories=categories
         )
+    
+    def _find_html_link(self, entry: etree._Element) -> str:
+        """Return the abstract page link of an entry, if present"""
+        for link in entry.iterfind(_LINK):
+            if link.get("rel") == "alternate":
+                return link.get("href")
+        return ""
@@ -2,6 +2,7 @@
 Crossref repository implementation
 """
 import httpx
+import orjson
 from datetime import datetime
 from typing import List, Optional
 
@@ -10,6 +11,10 @@ from ...domain.repositories.paper_repository import CrossrefRepository
 from ...domain.value_objects.search_query import SearchQuery
 
 
+# Only journal articles and conference papers that have an abstract
+_STATIC_FILTERS = "type:journal-article,type:proceedings-article,has-abstract:true"
+
+
 class CrossrefRepositoryImpl(CrossrefRepository):
     """
     Crossref repository implementation using Crossref API
@@ -19,36 +24,35 @@ class CrossrefRepositoryImpl(CrossrefRepository):
     def __init__(self):
         self.base_url = "https://api.crossref.org/works"
         self.timeout = 30.0
+        # Shared client so connections are kept alive across searches
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            headers={"User-Agent": "Hedwig/1.0 (mailto:research@hedwig.com)"}
+        )
     
     async def search_papers(self, search_query: SearchQuery) -> List[Paper]:
         """Search papers from Crossref based on query"""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = self._build_search_params(search_query)
-                headers = {"User-Agent": "Hedwig/1.0 (mailto:research@hedwig.com)"}
-                
-                response = await client.get(
-                    self.base_url, 
-                    params=params, 
-                    headers=headers
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                return self._parse_response(data)
-        except Exception as e:
-            print(f"Error searching Crossref: {e}")
-            return []
+        params = self._build_search_params(search_query)
+        response = await self._client.get(self.base_url, params=params)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        return self._parse_response(data)
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
     
     def _build_search_params(self, search_query: SearchQuery) -> dict:
         """Build search parameters for Crossref API"""
-        params = {
+        return {
             "query": search_query.query,
             "rows": search_query.max_results,
             "sort": self._map_sort_by(search_query.sort_by),
             "filter": self._build_filters(search_query)
         }
-        return {k: v for k, v in params.items() if v}
     
     def _map_sort_by(self, sort_by) -> str:
         """Map our sort_by enum to Crossref sort parameters"""
@@ -59,12 +63,9 @@ class CrossrefRepositoryImpl(CrossrefRepository):
         }
         return mapping.get(sort_by.value, "relevance")
     
-    def _build_filters(self, search_query: SearchQuery) -> Optional[str]:
+    def _build_filters(self, search_query: SearchQuery) -> str:
         """Build filter string for Crossref API"""
-        filters = []
-        
-        # Only include journal articles and conference papers
-        filters.append("type:journal-article,type:proceedings-article")
+        filters = [_STATIC_FILTERS]
         
         # Filter by date range if provided
         if search_query.date_from:
@@ -72,10 +73,7 @@ class CrossrefRepositoryImpl(CrossrefRepository):
         if search_query.date_to:
             filters.append(f"until-pub-date:{search_query.date_to}")
         
-        # Only include works with abstracts
-        filters.append("has-abstract:true")
-        
-        return ",".join(filters) if filters else None
+        return ",".join(filters)
     
     def _parse_response(self, data: dict) -> List[Paper]:
         """Parse Crossref API response and convert to Paper entities"""
@@ -85,43 +83,38 @@ class CrossrefRepositoryImpl(CrossrefRepository):
         items = message.get("items", [])
         
         for item in items:
-            try:
-                paper = self._convert_item_to_paper(item)
-                if paper:
-                    papers.append(paper)
-            except Exception as e:
-                print(f"Error parsing Crossref item: {e}")
-                continue
+            paper = self._convert_item_to_paper(item)
+            if paper:
+                papers.append(paper)
         
         return papers
     
     def _convert_item_to_paper(self, item: dict) -> Optional[Paper]:
         """Convert Crossref item to Paper entity"""
         # Skip items without abstract
-        abstract = item.get("abstract")
+        abstract = (item.get("abstract") or "").strip()
         if not abstract:
             return None
         
         # Extract title
-        title_list = item.get("title", [])
+        title_list = item.get("title")
         if not title_list:
             return None
         title = title_list[0].strip()
+        if not title:
+            return None
         
         # Extract authors
         authors = []
         for author_info in item.get("author", []):
-            given = author_info.get("given", "")
-            family = author_info.get("family", "")
+            family = author_info.get("family")
             if family:
-                name = f"{given} {family}".strip()
-                affiliation = None
-                if author_info.get("affiliation"):
-                    affiliation = author_info["affiliation"][0].get("name")
+                name = f"{author_info.get('given') or ''} {family}".strip()
+                affiliations = author_info.get("affiliation")
                 
                 authors.append(Author(
                     name=name,
-                    affiliation=affiliation,
+                    affiliation=affiliations[0].get("name") if affiliations else None,
                     orcid=author_info.get("ORCID")
                 ))
         
@@ -131,20 +124,16 @@ class CrossrefRepositoryImpl(CrossrefRepository):
         # Extract categories from subject areas
         categories = item.get("subject", [])[:5]  # Limit to 5 categories
         
-        # Parse published date
+        # Parse published date; missing month or day default to the first
         published_parts = item.get("published-print") or item.get("published-online")
-        if not published_parts or not published_parts.get("date-parts"):
+        date_parts = (published_parts or {}).get("date-parts")
+        if not date_parts or not date_parts[0]:
             return None
         
+        year, month, day = (list(date_parts[0]) + [1, 1])[:3]
         try:
-            date_parts = published_parts["date-parts"][0]
-            if len(date_parts) >= 3:
-                published_date = datetime(date_parts[0], date_parts[1], date_parts[2])
-            elif len(date_parts) >= 2:
-                published_date = datetime(date_parts[0], date_parts[1], 1)
-            else:
-                published_date = datetime(date_parts[0], 1, 1)
-        except (ValueError, IndexError):
+            published_date = datetime(year, month, day)
+        except (TypeError, ValueError):
             return None
         
         # Get DOI and URL
@@ -155,7 +144,7 @@ class CrossrefRepositoryImpl(CrossrefRepository):
             id=f"crossref:{doi}" if doi else f"crossref:{item.get('URL', '')}",
             title=title,
             authors=authors,
-            abstract=abstract.strip(),
+            abstract=abstract,
             source=PaperSource.CROSSREF,
             published_date=published_date,
             url=url,
@@ -1,14 +1,47 @@
 """
 OpenAlex repository implementation
 """
+import asyncio
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+
 import httpx
+import orjson
+from cachetools import LRUCache
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ...domain.entities.paper import Paper, Author, PaperSource
 from ...domain.repositories.paper_repository import OpenAlexRepository
 from ...domain.value_objects.search_query import SearchQuery
 
+logger = logging.getLogger(__name__)
+
+# Our sort_by values mapped to OpenAlex sort parameters
+_SORT_MAP = MappingProxyType({
+    "relevance": "relevance_score:desc",
+    "date": "publication_date:desc",
+    "citations": "cited_by_count:desc"
+})
+
+# Only the work fields read by _convert_work_to_paper
+_SELECT_FIELDS = "id,title,abstract_inverted_index,authorships,concepts,publication_date,doi,cited_by_count"
+
+# Rate limiting and transient server errors worth another attempt
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(slots=True)
+class _CachedSearch:
+    """Parsed results of one OpenAlex search plus what is needed to revalidate them"""
+    etag: Optional[str]
+    papers: List[Paper]
+    stored_at: float
+
 
 class OpenAlexRepositoryImpl(OpenAlexRepository):
     """
@@ -16,23 +49,94 @@ class OpenAlexRepositoryImpl(OpenAlexRepository):
     Follows Repository pattern and Single Responsibility Principle
     """
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.base_url = "https://api.openalex.org/works"
         self.timeout = 30.0
+        # Contact address that routes requests to OpenAlex's faster "polite pool"
+        self.contact_email = os.getenv("OPENALEX_CONTACT_EMAIL")
+        # Long-lived client, normally shared from the application lifespan
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(timeout=self.timeout, http2=True)
+        # Parsed papers per query; searches are read-only, so repeats can skip the network.
+        # Entries older than cache_ttl are kept and revalidated with their ETag.
+        self.cache_ttl = 600.0
+        self._cache: LRUCache = LRUCache(maxsize=1024)
+        # Retries for 429/5xx responses; waits longer than max_backoff are not worth
+        # it inside the service's per-source timeout, so those responses fail instead.
+        self.max_attempts = 3
+        self.initial_backoff = 0.2
+        self.max_backoff = 2.0
+        # Caps in-flight requests so bursts neither exhaust the connection pool
+        # nor trip OpenAlex's rate limit; held only for the GET, not retry waits.
+        self._sem = asyncio.Semaphore(32)
     
     async def search_papers(self, search_query: SearchQuery) -> List[Paper]:
         """Search papers from OpenAlex based on query"""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = self._build_search_params(search_query)
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                return self._parse_response(data)
-        except Exception as e:
-            print(f"Error searching OpenAlex: {e}")
-            return []
+        key = self._cache_key(search_query)
+        cached: Optional[_CachedSearch] = self._cache.get(key)
+        now = time.monotonic()
+        if cached and now - cached.stored_at < self.cache_ttl:
+            return cached.papers
+        
+        params = self._build_search_params(search_query)
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else None
+        response = await self._get_with_retry(params, headers)
+        logger.debug("OpenAlex responded %s over %s", response.status_code, response.http_version)
+        
+        # Stale entry is still current - skip downloading and parsing the body
+        if response.status_code == 304 and cached:
+            cached.stored_at = now
+            return cached.papers
+        response.raise_for_status()
+        
+        # Decoding and conversion are CPU-bound; keep them off the event loop
+        papers = await asyncio.to_thread(self._parse_response, response.content)
+        self._cache[key] = _CachedSearch(response.headers.get("ETag"), papers, now)
+        return papers
+    
+    async def _get_with_retry(self, params: dict, headers: Optional[dict]) -> httpx.Response:
+        """GET the works endpoint, retrying rate-limited and transient server errors"""
+        attempt = 1
+        while True:
+            async with self._sem:
+                response = await self._client.get(self.base_url, params=params, headers=headers)
+            if response.status_code not in _RETRY_STATUSES or attempt >= self.max_attempts:
+                return response
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+            logger.warning("OpenAlex responded %s, retrying in %.2fs", response.status_code, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None to give up"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                delay = max(float(retry_after), 0.0)
+            except ValueError:
+                # HTTP-date form; fall back to our own backoff
+                pass
+            else:
+                return delay if delay <= self.max_backoff else None
+        backoff = self.initial_backoff * 2 ** (attempt - 1)
+        return min(backoff + random.uniform(0, self.initial_backoff), self.max_backoff)
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client if this repository created it"""
+        if self._owns_client:
+            await self._client.aclose()
+    
+    def _cache_key(self, search_query: SearchQuery) -> Tuple:
+        """Build a cache key from the parameters sent to OpenAlex"""
+        return (
+            search_query.query,
+            search_query.max_results,
+            search_query.sort_by.value,
+            search_query.date_from,
+            search_query.date_to
+        )
     
     def _build_search_params(self, search_query: SearchQuery) -> dict:
         """Build search parameters for OpenAlex API"""
@@ -40,96 +144,102 @@ class OpenAlexRepositoryImpl(OpenAlexRepository):
             "search": search_query.query,
             "per-page": search_query.max_results,
             "sort": self._map_sort_by(search_query.sort_by),
-            "filter": self._build_filters(search_query)
+            "filter": self._build_filters(search_query),
+            "select": _SELECT_FIELDS
         }
-        return {k: v for k, v in params.items() if v}
+        if self.contact_email:
+            params["mailto"] = self.contact_email
+        return params
     
     def _map_sort_by(self, sort_by) -> str:
         """Map our sort_by enum to OpenAlex sort parameters"""
-        mapping = {
-            "relevance": "relevance_score:desc",
-            "date": "publication_date:desc",
-            "citations": "cited_by_count:desc"
-        }
-        return mapping.get(sort_by.value, "relevance_score:desc")
+        return _SORT_MAP.get(sort_by.value, "relevance_score:desc")
     
-    def _build_filters(self, search_query: SearchQuery) -> Optional[str]:
+    def _build_filters(self, search_query: SearchQuery) -> str:
         """Build filter string for OpenAlex API"""
-        filters = []
-        
-        if search_query.date_from or search_query.date_to:
-            date_filter = "publication_date:"
-            if search_query.date_from and search_query.date_to:
-                date_filter += f"{search_query.date_from}-{search_query.date_to}"
-            elif search_query.date_from:
-                date_filter += f">{search_query.date_from}"
-            elif search_query.date_to:
-                date_filter += f"<{search_query.date_to}"
-            filters.append(date_filter)
-        
-        # Only include works with abstracts
-        filters.append("has_abstract:true")
-        
-        return ",".join(filters) if filters else None
+        # Only include works with abstracts, optionally within a date range
+        date_from, date_to = search_query.date_from, search_query.date_to
+        if date_from and date_to:
+            return f"publication_date:{date_from}-{date_to},has_abstract:true"
+        if date_from:
+            return f"publication_date:>{date_from},has_abstract:true"
+        if date_to:
+            return f"publication_date:<{date_to},has_abstract:true"
+        return "has_abstract:true"
     
-    def _parse_response(self, data: dict) -> List[Paper]:
+    def _parse_response(self, content: bytes) -> List[Paper]:
         """Parse OpenAlex API response and convert to Paper entities"""
         papers = []
+        # Bound once outside the per-work loop
+        convert = self._convert_work_to_paper
+        append = papers.append
         
-        for work in data.get("results", []):
+        for work in orjson.loads(content).get("results", []):
+            if not isinstance(work, dict):
+                logger.warning("Skipping malformed OpenAlex work: %r", work)
+                continue
             try:
-                paper = self._convert_work_to_paper(work)
+                paper = convert(work)
                 if paper:
-                    papers.append(paper)
-            except Exception as e:
-                print(f"Error parsing OpenAlex work: {e}")
+                    append(paper)
+            except (KeyError, ValueError, TypeError, AttributeError) as e:
+                logger.warning("Skipping unparsable OpenAlex work %s: %s", work.get("id"), e)
                 continue
         
         return papers
     
     def _convert_work_to_paper(self, work: dict) -> Optional[Paper]:
         """Convert OpenAlex work to Paper entity"""
+        get = work.get
+        
         # Skip works without abstract
-        abstract = work.get("abstract")
+        abstract = self._reconstruct_abstract(get("abstract_inverted_index"))
         if not abstract:
             return None
         
+        # Skip untitled works
+        title = (get("title") or "").strip()
+        if not title:
+            return None
+        
         # Extract authors
-        authors = []
-        for authorship in work.get("authorships", []):
-            author_info = authorship.get("author", {})
-            if author_info.get("display_name"):
-                authors.append(Author(
-                    name=author_info["display_name"],
-                    orcid=author_info.get("orcid")
-                ))
+        authors = [
+            Author(name=author_info["display_name"], orcid=author_info.get("orcid"))
+            for authorship in get("authorships") or ()
+            if (author_info := authorship.get("author")) and author_info.get("display_name")
+        ]
         
         if not authors:
             return None
         
         # Extract concepts as categories
-        categories = []
-        for concept in work.get("concepts", [])[:5]:  # Top 5 concepts
-            if concept.get("display_name"):
-                categories.append(concept["display_name"])
+        categories = [
+            concept["display_name"]
+            for concept in (get("concepts") or [])[:5]  # Top 5 concepts
+            if concept.get("display_name")
+        ]
         
         # Parse published date
-        pub_date_str = work.get("publication_date")
+        pub_date_str = get("publication_date")
         if not pub_date_str:
             return None
         
+        # Dates are plain YYYY-MM-DD; check the length since fromisoformat takes other forms too
+        if len(pub_date_str) != 10:
+            return None
         try:
-            published_date = datetime.strptime(pub_date_str, "%Y-%m-%d")
+            published_date = datetime.fromisoformat(pub_date_str)
         except ValueError:
             return None
         
         # Get DOI or OpenAlex URL
-        doi = work.get("doi")
-        url = doi if doi else work.get("id", "")
+        work_id = get("id", "")
+        doi = get("doi")
+        url = doi if doi else work_id
         
         return Paper(
-            id=f"openalex:{work.get('id', '').split('/')[-1]}",
-            title=work.get("title", "").strip(),
+            id=f"openalex:{work_id.split('/')[-1]}",
+            title=title,
             authors=authors,
             abstract=abstract.strip(),
             source=PaperSource.OPENALEX,
@@ -137,5 +247,17 @@ class OpenAlexRepositoryImpl(OpenAlexRepository):
             url=url,
             doi=doi,
             categories=categories,
-            citation_count=work.get("cited_by_count", 0)
+            citation_count=get("cited_by_count", 0)
         )
+    
+    def _reconstruct_abstract(self, inverted_index: Optional[dict]) -> str:
+        """Rebuild abstract text from OpenAlex's word -> positions index"""
+        if not inverted_index:
+            return ""
+        words = [
+            (position, word)
+            for word, positions in inverted_index.items()
+            for position in positions
+        ]
+        words.sort()
+        return " ".join(word for _, word in words)
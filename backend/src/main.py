@@ -1,10 +1,63 @@
 """
 FastAPI application main entry point
 """
+import logging
+import os
+from contextlib import asynccontextmanager
+
+import httpx
+from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .api.routes import search, health
+from .application.services.paper_search_service import PaperSearchService
+
+# Settings may come from a .env file in the working directory:
+#   OPENALEX_CONTACT_EMAIL - contact address sent to OpenAlex to use its polite pool
+#   LOG_LEVEL - application log level (default INFO)
+load_dotenv()
+
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+# httpx logs every request URL at INFO, including the OpenAlex mailto parameter
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+async def _warm_up_openalex(client: httpx.AsyncClient) -> None:
+    """Open a pooled OpenAlex connection so the first search skips DNS and TLS setup"""
+    try:
+        await client.get(
+            "https://api.openalex.org/works",
+            params={"per-page": 1, "select": "id"},
+            timeout=5.0
+        )
+    except httpx.HTTPError as exc:
+        # Best effort only - searches will connect on demand
+        logger.warning("OpenAlex warm-up failed: %r", exc)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan - owns the search service and its HTTP connections"""
+    # HTTP/2 multiplexes concurrent OpenAlex searches over one connection
+    app.state.openalex_client = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+    await _warm_up_openalex(app.state.openalex_client)
+    app.state.paper_search_service = PaperSearchService(
+        openalex_client=app.state.openalex_client
+    )
+    yield
+    await app.state.paper_search_service.aclose()
+    await app.state.openalex_client.aclose()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -12,7 +65,9 @@ app = FastAPI(
     description="A minimal tool to search for research papers across arXiv, OpenAlex, and Crossref",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware for frontend integration
@@ -31,4 +86,5 @@ app.include_router(search.router)
 
 if __name__ == "__main__":
     import uvicorn
+    # uvicorn picks the uvloop event loop and httptools parser when installed
     uvicorn.run("src.main:app", host="0.0.0.0", port=8000, reload=True)
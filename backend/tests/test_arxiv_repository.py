@@ -0,0 +1,72 @@
+"""
+Tests for the arXiv repository
+"""
+import httpx
+
+from src.domain.value_objects.search_query import SearchQuery, SortBy
+from src.infrastructure.repositories.arxiv_repository import ArxivRepositoryImpl
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2101.00001v2</id>
+    <published>2021-01-01T12:34:56Z</published>
+    <title>Spatio-Temporal Graph Networks
+  for Traffic Forecasting</title>
+    <summary>We study traffic networks.</summary>
+    <author><name>Alice Smith</name></author>
+    <author><name>Bob Jones</name></author>
+    <link href="http://arxiv.org/abs/2101.00001v2" rel="alternate" type="text/html"/>
+    <category term="cs.LG"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2101.00002v1</id>
+    <published>2021-01-02T00:00:00Z</published>
+    <title>No abstract</title>
+    <summary> </summary>
+    <author><name>Carol</name></author>
+  </entry>
+</feed>
+"""
+
+
+def make_repository(handler) -> ArxivRepositoryImpl:
+    repository = ArxivRepositoryImpl()
+    repository._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return repository
+
+
+def test_format_query_for_arxiv():
+    format_query = ArxivRepositoryImpl._format_query_for_arxiv
+    
+    assert format_query("traffic networks") == "all:traffic AND all:networks"
+    assert format_query("  graph \t neural  ") == "all:graph AND all:neural"
+    assert format_query("") == ""
+
+
+async def test_search_sends_encoded_query_and_parses_feed():
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=FEED)
+    
+    repository = make_repository(handler)
+    papers = await repository.search_papers(
+        SearchQuery(query="traffic networks", max_results=3, sort_by=SortBy.DATE)
+    )
+    
+    url = requests[0].url
+    # Spaces are percent-encoded by httpx; a literal "+AND+" would arrive as %2BAND%2B
+    assert b"%2B" not in url.query
+    assert url.params["search_query"] == "all:traffic AND all:networks"
+    assert url.params["max_results"] == "3"
+    assert url.params["sortBy"] == "submittedDate"
+    
+    assert len(papers) == 1
+    paper = papers[0]
+    assert paper.id == "arxiv:2101.00001v2"
+    assert paper.title == "Spatio-Temporal Graph Networks   for Traffic Forecasting"
+    assert [author.name for author in paper.authors] == ["Alice Smith", "Bob Jones"]
+    assert paper.categories == ["cs.LG"]
+    assert paper.published_date.isoformat() == "2021-01-01T12:34:56"
@@ -0,0 +1,141 @@
+"""
+Tests for the OpenAlex repository
+"""
+import httpx
+import orjson
+import pytest
+
+from src.domain.entities.paper import PaperSource
+from src.domain.value_objects.search_query import SearchQuery
+from src.infrastructure.repositories.openalex_repository import OpenAlexRepositoryImpl
+
+
+def make_work(**overrides) -> dict:
+    """OpenAlex work shaped like a select= projected API result"""
+    work = {
+        "id": "https://openalex.org/W123",
+        "title": " Graph Networks for Traffic ",
+        "abstract_inverted_index": {"Traffic": [0, 3], "networks": [1], "predict": [2]},
+        "authorships": [
+            {"author": {"display_name": "Alice Smith", "orcid": "https://orcid.org/0000-0001"}},
+            {"author": {"display_name": None}},
+            {"author": None},
+        ],
+        "concepts": [{"display_name": f"c{i}"} for i in range(7)],
+        "publication_date": "2021-03-04",
+        "doi": "https://doi.org/10.1000/xyz",
+        "cited_by_count": 12,
+    }
+    work.update(overrides)
+    return work
+
+
+def make_repository(handler) -> OpenAlexRepositoryImpl:
+    return OpenAlexRepositoryImpl(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+def test_reconstruct_abstract_orders_words_by_position():
+    repository = OpenAlexRepositoryImpl()
+    inverted_index = {"world": [1, 3], "hello": [0], "big": [2]}
+    
+    assert repository._reconstruct_abstract(inverted_index) == "hello world big world"
+    assert repository._reconstruct_abstract(None) == ""
+    assert repository._reconstruct_abstract({}) == ""
+
+
+def test_convert_work_to_paper():
+    paper = OpenAlexRepositoryImpl()._convert_work_to_paper(make_work())
+    
+    assert paper.id == "openalex:W123"
+    assert paper.title == "Graph Networks for Traffic"
+    assert paper.abstract == "Traffic networks predict Traffic"
+    assert [author.name for author in paper.authors] == ["Alice Smith"]
+    assert paper.authors[0].orcid == "https://orcid.org/0000-0001"
+    assert paper.categories == ["c0", "c1", "c2", "c3", "c4"]
+    assert paper.published_date.isoformat() == "2021-03-04T00:00:00"
+    assert paper.url == paper.doi == "https://doi.org/10.1000/xyz"
+    assert paper.citation_count == 12
+    assert paper.source is PaperSource.OPENALEX
+
+
+@pytest.mark.parametrize("overrides", [
+    {"abstract_inverted_index": None},
+    {"title": None},
+    {"title": "   "},
+    {"authorships": []},
+    {"publication_date": None},
+    {"publication_date": "2021"},
+    {"publication_date": "2021-02-30"},
+])
+def test_convert_work_to_paper_skips_incomplete_works(overrides):
+    assert OpenAlexRepositoryImpl()._convert_work_to_paper(make_work(**overrides)) is None
+
+
+def test_parse_response_skips_malformed_works():
+    content = orjson.dumps({"results": [None, make_work(authorships=[None]), make_work()]})
+    
+    papers = OpenAlexRepositoryImpl()._parse_response(content)
+    
+    assert [paper.id for paper in papers] == ["openalex:W123"]
+
+
+async def test_search_requests_projected_fields():
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"results": [make_work()]})
+    
+    repository = make_repository(handler)
+    papers = await repository.search_papers(SearchQuery(query="traffic networks"))
+    
+    assert len(papers) == 1
+    params = requests[0].url.params
+    assert params["search"] == "traffic networks"
+    assert params["select"].split(",") == [
+        "id", "title", "abstract_inverted_index", "authorships",
+        "concepts", "publication_date", "doi", "cited_by_count"
+    ]
+
+
+async def test_search_revalidates_stale_results_with_etag():
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"results": [make_work()]}, headers={"ETag": '"v1"'})
+    
+    repository = make_repository(handler)
+    query = SearchQuery(query="traffic")
+    first = await repository.search_papers(query)
+    # Fresh entries are answered without a request
+    assert await repository.search_papers(query) is first
+    assert len(requests) == 1
+    
+    repository.cache_ttl = 0.0
+    assert await repository.search_papers(query) is first
+    assert len(requests) == 2
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+async def test_search_retries_rate_limited_requests():
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"results": [make_work()]}),
+    ]
+    repository = make_repository(lambda request: responses.pop(0))
+    
+    papers = await repository.search_papers(SearchQuery(query="traffic"))
+    
+    assert len(papers) == 1
+    assert not responses
+
+
+async def test_search_raises_after_exhausting_retries():
+    repository = make_repository(lambda request: httpx.Response(503))
+    repository.initial_backoff = repository.max_backoff = 0.0
+    
+    with pytest.raises(httpx.HTTPStatusError):
+        await repository.search_papers(SearchQuery(query="traffic"))
@@ -0,0 +1,141 @@
+"""
+Tests for the paper search application service
+"""
+import asyncio
+from datetime import datetime
+
+import httpx
+
+from src.application.services.paper_search_service import PaperSearchService
+from src.domain.entities.paper import Author, Paper, PaperSource
+from src.domain.repositories.paper_repository import PaperRepository
+from src.domain.value_objects.search_query import SearchQuery
+
+
+def make_paper(
+    paper_id: str,
+    title: str = "A Paper",
+    doi: str = None,
+    source: PaperSource = PaperSource.OPENALEX,
+    **kwargs
+) -> Paper:
+    return Paper(
+        id=paper_id,
+        title=title,
+        authors=[Author(name="Alice Smith")],
+        abstract="An abstract",
+        source=source,
+        published_date=kwargs.pop("published_date", datetime(2021, 1, 1)),
+        url=f"https://example.org/{paper_id}",
+        doi=doi,
+        **kwargs
+    )
+
+
+class FakeRepository(PaperRepository):
+    """Repository returning fixed papers, or failing, while counting its calls"""
+    
+    def __init__(self, papers=(), error: Exception = None, delay: float = 0.0):
+        self.papers = list(papers)
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+    
+    async def search_papers(self, search_query: SearchQuery):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.papers
+
+
+def make_service(**repositories: FakeRepository) -> PaperSearchService:
+    service = PaperSearchService()
+    service.repositories = repositories
+    return service
+
+
+def test_deduplicate_papers_matches_titles_ignoring_case_and_punctuation():
+    papers = [
+        make_paper("a", title="Graph Networks: A Survey"),
+        make_paper("b", title="graph networks - a  survey."),
+        make_paper("c", title="Graph Networks Revisited"),
+    ]
+    
+    unique = PaperSearchService()._deduplicate_papers(papers)
+    
+    assert [paper.id for paper in unique] == ["a", "c"]
+
+
+def test_deduplicate_papers_matches_doi_urls_and_bare_dois():
+    papers = [
+        make_paper("openalex:W1", title="Traffic Forecasting", doi="https://doi.org/10.1000/ABC"),
+        make_paper("crossref:1", title="Traffic forecasting (preprint)", doi="10.1000/abc"),
+        make_paper("crossref:2", title="Other", doi="http://dx.doi.org/10.1000/abc"),
+        make_paper("crossref:3", title="Unrelated", doi="10.1000/xyz"),
+        make_paper("arxiv:1", title="No DOI"),
+    ]
+    
+    unique = PaperSearchService()._deduplicate_papers(papers)
+    
+    assert [paper.id for paper in unique] == ["openalex:W1", "crossref:3", "arxiv:1"]
+
+
+async def test_search_papers_caches_results():
+    arxiv = FakeRepository([make_paper("arxiv:1", source=PaperSource.ARXIV)])
+    service = make_service(arxiv=arxiv)
+    query = SearchQuery(query="traffic", sources=["arxiv"])
+    
+    first = await service.search_papers(query)
+    second = await service.search_papers(query)
+    
+    assert second is first
+    assert arxiv.calls == 1
+    assert first["sources"]["arxiv"] == {"papers": first["papers"], "count": 1}
+
+
+async def test_concurrent_identical_searches_share_one_fan_out():
+    arxiv = FakeRepository([make_paper("arxiv:1", source=PaperSource.ARXIV)], delay=0.01)
+    service = make_service(arxiv=arxiv)
+    query = SearchQuery(query="traffic", sources=["arxiv"])
+    
+    results = await asyncio.gather(*(service.search_papers(query) for _ in range(5)))
+    
+    assert arxiv.calls == 1
+    assert all(result is results[0] for result in results)
+    assert not service._in_flight
+
+
+async def test_failed_sources_are_reported_and_not_cached():
+    request = httpx.Request("GET", "https://api.openalex.org/works?mailto=ops%40example.org")
+    outage = httpx.HTTPStatusError(
+        "503 for " + str(request.url), request=request, response=httpx.Response(503)
+    )
+    arxiv = FakeRepository([make_paper("arxiv:1", source=PaperSource.ARXIV)])
+    openalex = FakeRepository(error=outage)
+    crossref = FakeRepository(error=httpx.ConnectError("connection refused"))
+    service = make_service(arxiv=arxiv, openalex=openalex, crossref=crossref)
+    query = SearchQuery(query="traffic")
+    
+    results = await service.search_papers(query)
+    
+    assert [paper["id"] for paper in results["papers"]] == ["arxiv:1"]
+    assert results["sources"]["openalex"] == {"papers": [], "count": 0, "error": "HTTP 503"}
+    assert results["sources"]["crossref"]["error"] == "ConnectError"
+    
+    await service.search_papers(query)
+    assert (arxiv.calls, openalex.calls, crossref.calls) == (2, 2, 2)
+
+
+async def test_timed_out_sources_are_reported_and_not_cached():
+    arxiv = FakeRepository([make_paper("arxiv:1", source=PaperSource.ARXIV)])
+    crossref = FakeRepository(delay=1.0)
+    service = make_service(arxiv=arxiv, crossref=crossref)
+    service.source_timeout = 0.01
+    query = SearchQuery(query="traffic", sources=["arxiv", "crossref"])
+    
+    results = await service.search_papers(query)
+    
+    assert results["total_results"] == 1
+    assert results["sources"]["crossref"]["error"] == "timeout"
+    assert not service._results_cache
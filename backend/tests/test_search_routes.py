@@ -0,0 +1,110 @@
+"""
+Tests for the search API routes
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.routes.search import get_paper_search_service
+from src.main import app
+
+
+class StubSearchService:
+    """Service returning a fixed response, optionally with a failed source"""
+    
+    def __init__(self, source_error: str = None):
+        self.source_error = source_error
+    
+    async def search_papers(self, search_query):
+        sources = {"arxiv": {"papers": [], "count": 0}}
+        if self.source_error:
+            sources["crossref"] = {"papers": [], "count": 0, "error": self.source_error}
+        return {
+            "query": search_query.query,
+            "total_results": 0,
+            "papers": [],
+            "sources": sources,
+            "search_params": {
+                "max_results": search_query.max_results,
+                "sort_by": search_query.sort_by.value,
+                "sources": search_query.enabled_sources
+            }
+        }
+
+
+@pytest.fixture
+def make_client():
+    """Client for the app with the search service replaced; the lifespan is not run"""
+    def make(service=None) -> TestClient:
+        app.dependency_overrides[get_paper_search_service] = lambda: service or StubSearchService()
+        return TestClient(app)
+    
+    yield make
+    app.dependency_overrides.clear()
+
+
+def test_get_sets_etag_and_cache_control(make_client):
+    response = make_client().get("/api/search/papers", params={"query": "traffic"})
+    
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+    assert response.headers["ETag"].startswith('"')
+    assert response.json()["query"] == "traffic"
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "W/{etag}",
+    '"other", {etag}',
+    "*",
+])
+def test_get_answers_matching_if_none_match_with_304(make_client, if_none_match):
+    client = make_client()
+    etag = client.get("/api/search/papers", params={"query": "traffic"}).headers["ETag"]
+    
+    response = client.get(
+        "/api/search/papers",
+        params={"query": "traffic"},
+        headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+    
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_get_ignores_non_matching_if_none_match(make_client):
+    response = make_client().get(
+        "/api/search/papers", params={"query": "traffic"}, headers={"If-None-Match": '"stale"'}
+    )
+    
+    assert response.status_code == 200
+
+
+def test_get_with_failed_source_is_not_cacheable(make_client):
+    response = make_client(StubSearchService(source_error="timeout")).get(
+        "/api/search/papers", params={"query": "traffic"}, headers={"If-None-Match": "*"}
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-store"
+    assert "ETag" not in response.headers
+
+
+@pytest.mark.parametrize("params, field", [
+    ({"query": "traffic", "sources": "bogus"}, "sources"),
+    ({"query": "traffic", "date_from": "2024-W01-1"}, "date_from"),
+    ({"query": "traffic", "date_to": "2024-1-1"}, "date_to"),
+])
+def test_get_rejects_invalid_parameters_with_422(make_client, params, field):
+    response = make_client().get("/api/search/papers", params=params)
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", field]
+
+
+def test_post_returns_service_results(make_client):
+    response = make_client().post("/api/search/papers", json={"query": "traffic", "max_results": 3})
+    
+    assert response.status_code == 200
+    assert response.json()["search_params"]["max_results"] == 3
+    assert "ETag" not in response.headers